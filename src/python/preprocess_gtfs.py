@@ -8,14 +8,19 @@
 # 発車時刻やヘッドサインなどの情報を抽出し、JSON形式で保存します。
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import zipfile
+import io
 import logging
 import argparse
 from typing import Dict, List, Optional, Tuple, Any
 import json
+import numpy as np
+import orjson
 import pandas as pd
 import os
 import partridge as ptg
+from partridge.parsers import vparse_time
 
 # ログ設定
 logging.basicConfig(
@@ -24,6 +29,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# プロジェクトのルートディレクトリ（src/python の2つ上）
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 
 class GTFSProcessor:
     """GTFS データを処理してサイネージ用データを生成するクラス"""
@@ -42,6 +50,13 @@ class GTFSProcessor:
         self.platform_config = self.config["platform"]
         self.date_change_hour = self.config.get("date_change_hour", 3)
         self.gtfs_providers = list(self.gtfs_files.keys())
+
+        # 翻訳データの検索用辞書（フィードごとに_read_translationsで構築）
+        self._trans_by_record: Dict[Tuple[str, str, str, str], str] = {}
+        self._trans_by_value: Dict[Tuple[str, str, str, str], str] = {}
+
+        # プロバイダーごとのtrip_id・route_idをインデックスとしたtrips/routes
+        self._indexed_tables: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = {}
         
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """設定ファイルを読み込む"""
@@ -68,97 +83,142 @@ class GTFSProcessor:
     
     def _resolve_gtfs_paths(self, gtfs_files_config: Dict[str, str]) -> Dict[str, str]:
         """GTFSファイルパスを新しいディレクトリ構造に合わせて解決する"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(script_dir))
-        
-        resolved_paths = {}
-        for provider, relative_path in gtfs_files_config.items():
-            resolved_paths[provider] = os.path.join(project_root, relative_path)
-        
-        return resolved_paths
+        return {
+            provider: os.path.join(_PROJECT_ROOT, relative_path)
+            for provider, relative_path in gtfs_files_config.items()
+        }
     
     def _resolve_output_path(self, output_file: str) -> str:
         """出力ファイルパスを新しいディレクトリ構造に合わせて解決する"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(script_dir))
-        
-        new_output_path = os.path.join(project_root, output_file)
+        new_output_path = os.path.join(_PROJECT_ROOT, output_file)
         
         # 出力ディレクトリが存在しない場合は作成
-        if not os.path.exists(os.path.dirname(new_output_path)):
-            os.makedirs(os.path.dirname(new_output_path), exist_ok=True)
+        os.makedirs(os.path.dirname(new_output_path), exist_ok=True)
         
         return new_output_path
 
-    def _read_translations(self, gtfs_file: str) -> Optional[pd.DataFrame]:
+    def _read_translations(self, z: zipfile.ZipFile) -> Optional[pd.DataFrame]:
         """
-        GTFSファイルから翻訳データを読み込む
+        GTFSファイルから翻訳データを読み込み、検索用の辞書を構築する
         
         Args:
-            gtfs_file: GTFSファイルのパス
+            z: 開いているGTFSファイルのZipFile
             
         Returns:
             翻訳データのDataFrame（存在しない場合はNone）
         """
-        if not os.path.exists(gtfs_file):
-            raise FileNotFoundError(f"GTFSファイルが見つかりません: {gtfs_file}")
+        self._trans_by_record = {}
+        self._trans_by_value = {}
 
         try:
-            with zipfile.ZipFile(gtfs_file, 'r') as z:
-                if 'translations.txt' not in z.namelist():
-                    logger.warning(f"translations.txt が見つかりません: {gtfs_file}")
-                    return None
-                    
-                with z.open('translations.txt') as f:
-                    translations = pd.read_csv(f, sep=',', encoding='utf-8')
-                    return translations
+            if 'translations.txt' not in z.namelist():
+                logger.warning(f"translations.txt が見つかりません: {z.filename}")
+                return None
+                
+            # 一度にすべて展開し、メモリ上のバイト列から解析する
+            data = z.read('translations.txt')
+            translations = pd.read_csv(io.BytesIO(data), sep=',', encoding='utf-8')
+
+            # 重複の多い列はカテゴリ型にしてメモリ使用量と比較コストを削減
+            for column in ['table_name', 'field_name', 'language']:
+                if column in translations.columns:
+                    translations[column] = translations[column].astype('category')
+
+            self._trans_by_record = self._build_translation_index(translations, 'record_id')
+            self._trans_by_value = self._build_translation_index(translations, 'field_value')
+            return translations
         except Exception as e:
             logger.warning(f"翻訳データの読み込みに失敗しました: {e}")
             return None
 
-    def _get_translation(self, translations: Optional[pd.DataFrame], 
-                        table_name: str, field_name: str, 
-                        language: str, identifier: str) -> str:
+    def _read_stop_times_filtered(self, z: zipfile.ZipFile, stop_ids: List[str],
+                                  chunksize: int = 100000) -> pd.DataFrame:
         """
-        翻訳データから指定された翻訳を取得する
+        stop_times.txtを分割して読み込み、指定された停留所の行のみを抽出する
+        
+        Args:
+            z: 開いているGTFSファイルのZipFile
+            stop_ids: 抽出する停留所IDのリスト
+            chunksize: 一度に読み込む行数
+            
+        Returns:
+            抽出したstop_timesのDataFrame（departure_timeは0時からの秒数、
+            can_pickupは乗車可能かどうか）
+        """
+        columns = ['trip_id', 'stop_id', 'departure_time', 'stop_headsign', 'pickup_type']
+        chunks = []
+
+        with z.open('stop_times.txt') as f:
+            reader = pd.read_csv(
+                f, dtype=str, encoding='utf-8-sig', index_col=False,
+                usecols=lambda column: column.strip() in columns,
+                chunksize=chunksize
+            )
+            for chunk in reader:
+                # 列名・値の前後の空白を除去してから停留所IDで絞り込む
+                chunk = chunk.rename(columns=lambda column: column.strip())
+                for column in chunk.columns:
+                    chunk[column] = chunk[column].str.strip()
+                chunks.append(chunk[chunk['stop_id'].isin(stop_ids)])
+
+        stop_times = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+        stop_times = stop_times.reindex(columns=columns)
+        if not stop_times.empty:
+            stop_times['departure_time'] = vparse_time(stop_times['departure_time'])
+
+        # pickup_typeは欠損を許容する整数型にし、乗車可能（空欄または0）かどうかを先に判定しておく
+        stop_times['pickup_type'] = pd.to_numeric(stop_times['pickup_type']).astype('Int8')
+        stop_times['can_pickup'] = (stop_times['pickup_type'].fillna(0) == 0).astype(bool)
+
+        # 結合・グループ化のキーとなるID列はカテゴリ型にする
+        for column in ['trip_id', 'stop_id']:
+            stop_times[column] = stop_times[column].astype('category')
+        return stop_times
+
+    def _build_translation_index(self, translations: pd.DataFrame,
+                                 key_column: str) -> Dict[Tuple[str, str, str, str], str]:
+        """
+        翻訳データから (table_name, field_name, language, key_column) をキーとする辞書を作成する
         
         Args:
             translations: 翻訳データのDataFrame
+            key_column: キーに用いる列名（record_id または field_value）
+            
+        Returns:
+            翻訳文字列の辞書
+        """
+        if key_column not in translations.columns:
+            return {}
+
+        keys = ['table_name', 'field_name', 'language', key_column]
+
+        # 同じキーが複数ある場合は先頭の行を優先する
+        indexed = translations.dropna(subset=[key_column]).drop_duplicates(subset=keys, keep='first')
+        return indexed.set_index(keys)['translation'].to_dict()
+
+    def _get_translation_map(self, table_name: str, field_name: str,
+                             language: str) -> Dict[str, str]:
+        """
+        指定されたテーブル・フィールド・言語の翻訳を、識別子をキーとした辞書として取得する
+        
+        Args:
             table_name: テーブル名
             field_name: フィールド名
             language: 言語コード
-            identifier: レコードIDまたはフィールド値
             
         Returns:
-            翻訳文字列（見つからない場合は空文字列）
+            レコードIDまたはフィールド値をキーとした翻訳文字列の辞書
         """
-        if translations is None or translations.empty:
-            return ''
-            
-        # record_idでの検索を試行
-        mask = (
-            (translations['table_name'] == table_name) &
-            (translations['field_name'] == field_name) &
-            (translations['language'] == language) &
-            (translations['record_id'] == identifier)
-        )
-        matched = translations[mask]
-        
-        # record_idで見つからない場合、field_valueでの検索を試行
-        if matched.empty:
-            mask = (
-                (translations['table_name'] == table_name) &
-                (translations['field_name'] == field_name) &
-                (translations['language'] == language) &
-                (translations['field_value'] == str(identifier))
-            )
-            matched = translations[mask]
-        
-        return matched.iloc[0]['translation'] if not matched.empty else ''
+        target = (table_name, field_name, language)
 
-    def _date_to_str(self, date) -> str:
-        """datetime.dateをYYYY-MM-DD形式の文字列に変換"""
-        return date.strftime('%Y-%m-%d')
+        # field_valueでの翻訳をrecord_idでの翻訳で上書きし、record_idを優先する
+        translation_map = {
+            key[3]: translation for key, translation in self._trans_by_value.items() if key[:3] == target
+        }
+        translation_map.update({
+            key[3]: translation for key, translation in self._trans_by_record.items() if key[:3] == target
+        })
+        return translation_map
 
     def _process_calendar_data(self, feed, gtfs_prefix: str) -> Dict[str, List[Dict[str, str]]]:
         """
@@ -180,167 +240,218 @@ class GTFSProcessor:
             logger.warning("calendar および calendar_dates データが見つかりません")
             return {}
         
-        calendar = defaultdict(set)
+        # サービスが追加される (date, service_id) の組
+        added_frames = []
         
         # calendarデータの処理
         if calendar_exists:
-            for _, row in feed.calendar.iterrows():
-                service_id = row['service_id']
-                start_date = row['start_date']
-                end_date = row['end_date']
-                valid_days = [
-                    row['monday'], row['tuesday'], row['wednesday'],
-                    row['thursday'], row['friday'], row['saturday'], row['sunday']
-                ]
-                
-                date_range = pd.date_range(start=start_date, end=end_date)
-                for date in date_range:
-                    day_of_week = date.weekday()
-                    if valid_days[day_of_week]:
-                        date_str = self._date_to_str(date)
-                        calendar[date_str].add((gtfs_prefix, service_id))
+            cal = feed.calendar
+            starts = cal['start_date'].values.astype('datetime64[D]')
+            ends = cal['end_date'].values.astype('datetime64[D]')
+            lens = np.maximum((ends - starts).astype(np.int64) + 1, 0)
+            valid_days = cal[[
+                'monday', 'tuesday', 'wednesday',
+                'thursday', 'friday', 'saturday', 'sunday'
+            ]].to_numpy(dtype=np.uint8)
+
+            # 全サービスの有効期間を一括で日付単位に展開
+            # （各行の先頭位置は展開済みの行インデックスから引き、np.repeatを1回に抑える）
+            idx = np.repeat(np.arange(len(cal)), lens)
+            offsets = np.arange(len(idx)) - (np.cumsum(lens) - lens)[idx]
+            dates = starts[idx] + offsets
+
+            # 1970-01-01は木曜日のため、4日ずらして月曜日を0とする
+            day_of_week = (dates.view('int64') - 4) % 7
+            mask = valid_days[idx, day_of_week].astype(bool)
+
+            added_frames.append(pd.DataFrame({
+                'date': dates[mask],
+                'service_id': cal['service_id'].values[idx[mask]]
+            }))
 
         # calendar_datesデータの処理
+        removed = None
         if calendar_dates_exists:
-            for _, row in feed.calendar_dates.iterrows():
-                service_id = row['service_id']
-                date = row['date']
-                exception_type = row['exception_type']
-                
-                date_str = self._date_to_str(date)
-                if exception_type == 1:  # サービス追加
-                    calendar[date_str].add((gtfs_prefix, service_id))
-                elif exception_type == 2:  # サービス削除
-                    calendar[date_str].discard((gtfs_prefix, service_id))
+            cal_dates = feed.calendar_dates
+            exceptions = pd.DataFrame({
+                'date': cal_dates['date'].values.astype('datetime64[D]'),
+                'service_id': cal_dates['service_id'].values
+            })
+            exception_type = cal_dates['exception_type'].values
+            added_frames.append(exceptions[exception_type == 1])  # サービス追加
+            removed = exceptions[exception_type == 2]  # サービス削除
+
+        added = pd.concat(added_frames, ignore_index=True).drop_duplicates()
+        if removed is not None and not removed.empty:
+            # 削除対象の組を除外（アンチジョイン）
+            added = added.merge(removed.drop_duplicates(), how='left', indicator=True)
+            added = added[added['_merge'] == 'left_only'].drop(columns='_merge')
 
-        # setをlistに変換してdictとして返す
+        # 日付をまとめてYYYY-MM-DD形式の文字列に変換し、日付ごとにdictとして返す
+        added['date'] = np.datetime_as_string(added['date'].values.astype('datetime64[D]'), unit='D')
+        added['gtfs_id'] = gtfs_prefix
         return {
-            date: [{'gtfs_id': gtfs_id, 'service_id': svc_id} 
-                   for gtfs_id, svc_id in service_ids] 
-            for date, service_ids in calendar.items()
+            date: group[['gtfs_id', 'service_id']].to_dict(orient='records')
+            for date, group in added.groupby('date')
         }
 
-    def _create_departure_record(self, row, trip_row, route_row, gtfs_prefix: str, 
-                                translations: Optional[pd.DataFrame]) -> Dict[str, Any]:
+    def _get_indexed_tables(self, feed, gtfs_prefix: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
-        発車情報レコードを作成する
+        trip_id・route_idをインデックスとしたtrips/routesを取得する（プロバイダーごとにキャッシュ）
         
         Args:
-            row: stop_timesの行データ
-            trip_row: tripsの行データ
-            route_row: routesの行データ
+            feed: partridgeのfeedオブジェクト
             gtfs_prefix: GTFSプロバイダーのプレフィックス
-            translations: 翻訳データ(translations.txtそのままのDataFrame)
             
         Returns:
-            発車情報の辞書
+            (trips, routes) のタプル
         """
-        # headsignの取得（優先順位: stop_headsign > trip_headsign）
-        headsign = row.get('stop_headsign', '')
-        if pd.isna(headsign) or not headsign:
-            headsign = trip_row['trip_headsign'].values[0] if 'trip_headsign' in trip_row.columns else ''
-            if pd.isna(headsign):
-                headsign = ''
-                
-        # route_nameの取得（優先順位: route_short_name > route_long_name）
-        route_name = route_row['route_short_name'].values[0] if 'route_short_name' in route_row.columns else ''
-        if pd.isna(route_name) or not route_name:
-            route_name = route_row['route_long_name'].values[0] if 'route_long_name' in route_row.columns else ''
-            if pd.isna(route_name):
-                route_name = ''
-        
-        # route_colorとroute_text_colorの取得
-        route_color = route_row['route_color'].values[0] if 'route_color' in route_row.columns else ''
-        if pd.isna(route_color):
-            route_color = ''
-            
-        route_text_color = route_row['route_text_color'].values[0] if 'route_text_color' in route_row.columns else ''
-        if pd.isna(route_text_color):
-            route_text_color = ''
-            
-        # service_idの取得
-        service_id = trip_row['service_id'].values[0] if 'service_id' in trip_row.columns else ''
-        if pd.isna(service_id):
-            service_id = ''
-        
-        # 英語翻訳の取得
-        route_id = trip_row['route_id'].values[0]
-        route_name_en = self._get_translation(translations, 'routes', 'route_long_name', 'en', route_id)
-        headsign_en = self._get_translation(translations, 'stop_times', 'stop_headsign', 'en', headsign)
-        # TODO: translations.txtの別の形式にも対応する
+        if gtfs_prefix not in self._indexed_tables:
+            # 重複IDは先頭の行を優先
+            trips = feed.trips.reindex(
+                columns=['trip_id', 'route_id', 'service_id', 'trip_headsign']
+            ).drop_duplicates(subset='trip_id').set_index('trip_id')
+            trips['route_id'] = trips['route_id'].astype('category')
+            routes = feed.routes.reindex(
+                columns=['route_id', 'route_short_name', 'route_long_name', 'route_color', 'route_text_color']
+            ).drop_duplicates(subset='route_id').set_index('route_id')
+            self._indexed_tables[gtfs_prefix] = (trips, routes)
 
-        return {
-            'departure_time': row['departure_time'],
-            'route_name': str(route_name),
-            'route_name_en': str(route_name_en),
-            'route_color': str(route_color),
-            'route_text_color': str(route_text_color),
-            'headsign': str(headsign),
-            'headsign_en': str(headsign_en),
-            'gtfs_id': str(gtfs_prefix),
-            'service_id': str(service_id)
-        }
+        return self._indexed_tables[gtfs_prefix]
 
-    def _process_stop_departures(self, stop_id_list: List[str], feed, 
-                                gtfs_prefix: str, translations: Optional[pd.DataFrame]) -> List[List[Dict[str, Any]]]:
+    def _process_stop_departures(self, stop_id_list: List[str], stop_times: pd.DataFrame,
+                                feed, gtfs_prefix: str) -> Dict[str, pd.DataFrame]:
         """
-        停留所リストの発車情報を処理する
+        停留所リストの発車情報をまとめて処理する
         
         Args:
-            stop_id_list: 停留所IDのリスト
+            stop_id_list: 停留所IDのリスト（重複なし）
+            stop_times: _read_stop_times_filtered で抽出したstop_times
             feed: partridgeのfeedオブジェクト
             gtfs_prefix: GTFSプロバイダーのプレフィックス
-            translations: 翻訳データ
             
         Returns:
-            停留所ごとの発車情報リスト
+            停留所IDをキーとした発車情報DataFrameの辞書
         """
-        departures_list = []
+        # 対象停留所の乗車可能なstop_timesをまとめて抽出
+        stop_times = stop_times[stop_times['stop_id'].isin(stop_id_list) & stop_times['can_pickup']]
+        found_stop_ids = set(stop_times['stop_id'].unique())
+        stop_times = stop_times[stop_times['departure_time'].notna()]
+
+        # stop_times → trips → routes をインデックスで一度に結合
+        trips, routes = self._get_indexed_tables(feed, gtfs_prefix)
+        merged = stop_times.join(trips, on='trip_id', how='inner').join(routes, on='route_id', how='inner')
+
+        # headsignの取得（優先順位: stop_headsign > trip_headsign）
+        stop_headsign = merged['stop_headsign']
+        headsign = stop_headsign.where(
+            stop_headsign.notna() & (stop_headsign != ''), merged['trip_headsign']
+        ).fillna('').astype(str)
+
+        # route_nameの取得（優先順位: route_short_name > route_long_name）
+        route_short_name = merged['route_short_name']
+        route_name = route_short_name.where(
+            route_short_name.notna() & (route_short_name != ''), merged['route_long_name']
+        ).fillna('').astype(str)
+
+        # 英語翻訳の取得
+        route_name_en = merged['route_id'].astype(str).map(
+            self._get_translation_map('routes', 'route_long_name', 'en')
+        ).fillna('').astype(str)
+        headsign_en = headsign.map(
+            self._get_translation_map('stop_times', 'stop_headsign', 'en')
+        ).fillna('').astype(str)
+        # TODO: translations.txtの別の形式にも対応する
+
+        # 発車時刻の抽出と整形
+        departures = pd.DataFrame({
+            'departure_time': merged['departure_time'],
+            'route_name': route_name,
+            'route_name_en': route_name_en,
+            'route_color': merged['route_color'].fillna('').astype(str),
+            'route_text_color': merged['route_text_color'].fillna('').astype(str),
+            'headsign': headsign,
+            'headsign_en': headsign_en,
+            'gtfs_id': str(gtfs_prefix),
+            'service_id': merged['service_id'].fillna('').astype(str)
+        })
+
+        # stop_idのカテゴリコードで安定ソートし、停留所ごとの範囲を二分探索で切り出せるようにする
+        stop_categories = merged['stop_id'].cat.categories
+        stop_codes = merged['stop_id'].cat.codes.to_numpy()
+        order = np.argsort(stop_codes, kind='stable')
+        stop_codes = stop_codes[order]
+        departures = departures.iloc[order]
+
+        departures_by_stop = {}
         
         for stop_id in stop_id_list:
-            if stop_id is None:
-                departures_list.append([])
-                continue
-                
             logger.info(f"停留所ID: {stop_id} のデータを処理中...")
             
             # 停留所データの存在チェック
-            stop_times = feed.stop_times[
-                (feed.stop_times['stop_id'] == stop_id) &
-                (feed.stop_times['pickup_type'].isna() | (feed.stop_times['pickup_type'].astype(int) == 0))
-            ]
-            
-            if stop_times.empty:
+            if stop_id not in found_stop_ids:
                 logger.warning(f"停留所ID {stop_id} のデータが見つかりません")
-                departures_list.append([])
+                departures_by_stop[stop_id] = departures.iloc[0:0]
                 continue
-                
-            trips = feed.trips[feed.trips['trip_id'].isin(stop_times['trip_id'])]
-            routes = feed.routes[feed.routes['route_id'].isin(trips['route_id'])]
-                
-            # 発車時刻の抽出と整形
-            departures = []
-            for _, row in stop_times.iterrows():
-                if pd.isna(row['departure_time']):
-                    continue
-                    
-                trip_row = trips[trips['trip_id'] == row['trip_id']]
-                if trip_row.empty:
-                    continue
-                        
-                route_id = trip_row['route_id'].values[0]
-                route_row = routes[routes['route_id'] == route_id]
-                if route_row.empty:
-                    continue
-                
-                departure_record = self._create_departure_record(
-                    row, trip_row, route_row, gtfs_prefix, translations
-                )
-                departures.append(departure_record)
-            
-            departures_list.append(departures)
+
+            code = stop_categories.get_loc(stop_id)
+            lo = np.searchsorted(stop_codes, code, side='left')
+            hi = np.searchsorted(stop_codes, code, side='right')
+            departures_by_stop[stop_id] = departures.iloc[lo:hi]
         
-        return departures_list
+        return departures_by_stop
+
+    def _process_provider(self, provider: str) -> Tuple[Dict[str, pd.DataFrame], Dict[str, List[Dict[str, str]]]]:
+        """
+        1つのGTFSプロバイダーのデータを処理する（プロセスプールから呼び出される）
+        
+        Args:
+            provider: GTFSプロバイダー名
+            
+        Returns:
+            (プラットフォームごとの発車情報DataFrame, 日付をキーとしたサービスID辞書) のタプル
+        """
+        gtfs_file = self.gtfs_files[provider]
+        if not os.path.exists(gtfs_file):
+            raise FileNotFoundError(f"GTFSファイルが見つかりません: {gtfs_file}")
+            
+        logger.info(f"GTFSファイルを読み込み中: {gtfs_file} (プロバイダー: {provider})")
+        # 設定された停留所のstop_timesのみを抽出し、関係するレコードのみを読み込む
+        needed_stop_ids = sorted({
+            stop_id
+            for stop_configs in self.platform_config.values()
+            for prov, stop_id in stop_configs
+            if prov == provider and stop_id is not None
+        })
+        # stop_times・translationsは同じZipFileから読み込み、セントラルディレクトリの解析を1回で済ませる
+        with zipfile.ZipFile(gtfs_file, 'r') as z:
+            stop_times = self._read_stop_times_filtered(z, needed_stop_ids)
+            translations = self._read_translations(z)
+        if translations is not None and not translations.empty:
+            logger.info("翻訳データを読み込みました")
+
+        feed = ptg.load_feed(gtfs_file, view={'trips.txt': {'trip_id': stop_times['trip_id'].unique().tolist()}})
+
+        # 全プラットフォームの停留所データを一度に処理
+        departures_by_stop = self._process_stop_departures(
+            needed_stop_ids, stop_times, feed, provider
+        )
+
+        # 取得したデータを設定順にプラットフォームへ振り分け
+        departure_info = {}
+        for platform_num, stop_configs in self.platform_config.items():
+            platform_departures = [
+                departures_by_stop[stop_id]
+                for prov, stop_id in stop_configs
+                if prov == provider and stop_id is not None
+            ]
+            if platform_departures:
+                departure_info[platform_num] = pd.concat(platform_departures, ignore_index=True)
+
+        # カレンダーデータを処理
+        calendar = self._process_calendar_data(feed, provider)
+
+        return departure_info, calendar
 
     def process_gtfs_data(self) -> Dict[str, Any]:
         """
@@ -351,42 +462,26 @@ class GTFSProcessor:
         """
         logger.info("GTFS前処理を開始します...")
         
-        # 初期化
-        departure_info = {platform_num: [] for platform_num in self.platform_config.keys()}
+        # 初期化（発車情報は出力直前まで列形式のDataFrameのまま保持する）
+        departure_frames = {platform_num: [] for platform_num in self.platform_config.keys()}
         calendar = defaultdict(list)
 
-        # 各GTFSプロバイダーのデータを処理
-        for provider in self.gtfs_providers:
-            gtfs_file = self.gtfs_files[provider]
-            if not os.path.exists(gtfs_file):
-                raise FileNotFoundError(f"GTFSファイルが見つかりません: {gtfs_file}")
-                
-            logger.info(f"GTFSファイルを読み込み中: {gtfs_file} (プロバイダー: {provider})")
-            feed = ptg.load_feed(gtfs_file)
-            
-            translations = self._read_translations(gtfs_file)
-            if translations is not None and not translations.empty:
-                logger.info("翻訳データを読み込みました")
+        # 各GTFSプロバイダーのデータを並列に処理し、設定順に結果をまとめる
+        max_workers = min(len(self.gtfs_providers), os.cpu_count() or 1) or None
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for gtfs_departure_info, gtfs_calendar in executor.map(self._process_provider, self.gtfs_providers):
+                for platform_num, departures in gtfs_departure_info.items():
+                    if not departures.empty:
+                        departure_frames[platform_num].append(departures)
 
-            # プラットフォームごとに停留所データを処理
-            for platform_num, stop_configs in self.platform_config.items():
-                provider_stops = [stop_id for prov, stop_id in stop_configs if prov == provider]
-                
-                if provider_stops:
-                    gtfs_departure_info = self._process_stop_departures(
-                        provider_stops, feed, provider, translations
-                    )
-                    
-                    # 取得したデータをプラットフォームに追加
-                    for departures in gtfs_departure_info:
-                        if departures:
-                            departure_info[platform_num].extend(departures)
-
-            # カレンダーデータを処理
-            gtfs_calendar = self._process_calendar_data(feed, provider)
-            for date, service_ids in gtfs_calendar.items():
-                calendar[date].extend(service_ids)
+                for date, service_ids in gtfs_calendar.items():
+                    calendar[date].extend(service_ids)
 
+        # プラットフォームごとに一度だけ辞書のリストへ変換
+        departure_info = {
+            platform_num: pd.concat(frames, ignore_index=True).to_dict(orient='records') if frames else []
+            for platform_num, frames in departure_frames.items()
+        }
         
         return {
             'departure_info': departure_info,
@@ -409,8 +504,9 @@ class GTFSProcessor:
             if output_dir:
                 os.makedirs(output_dir, exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(signage_data, f, ensure_ascii=False, indent=2)
+            # orjsonはUTF-8のバイト列を出力するため、バイナリモードで書き込む
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(signage_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             logger.info(f"前処理が完了しました。出力ファイル: {output_file}")
         except IOError as e:
             raise IOError(f"ファイルの保存に失敗しました: {e}")